@@ -2,11 +2,19 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import ttk 
 import os
+import queue
 import threading
 
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
-from word_to_pdf_converter import WordConverterLogic, BatchConverter
+from word_to_pdf_converter import WordConverterLogic, BatchConverter, WORD_EXTENSIONS
+
+# The status log is fed through a queue and drained on a Tk timer, so conversion threads
+# never wait on the GUI. Each tick inserts at most _LOG_DRAIN_BATCH messages.
+_LOG_DRAIN_INTERVAL_MS = 50
+_LOG_DRAIN_BATCH = 200
+# How often the closing window checks whether the converter has finished shutting down.
+_SHUTDOWN_POLL_INTERVAL_MS = 100
 
 class WordToPdfConverterApp:
     """
@@ -29,6 +37,13 @@ class WordToPdfConverterApp:
         self.naming_rule_var.set(self.naming_rules[0])
         self.naming_rule_var.trace_add("write", self.on_naming_rule_change)
 
+        self.skip_up_to_date_var = tk.BooleanVar(master, value=False)
+
+        self._log_queue = queue.SimpleQueue()
+        # Latest (completed, total) from the batch thread; the log drain timer shows it.
+        self._latest_progress = None
+        self._shown_progress = None
+
         self.batch_converter = BatchConverter(log_callback=self.log_status)
         self.converter_logic = WordConverterLogic(log_callback=self.log_status)
 
@@ -101,6 +116,9 @@ class WordToPdfConverterApp:
         self.naming_rule_menu.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
         self.naming_rule_menu.config(width=20)
 
+        self.skip_up_to_date_check = tk.Checkbutton(master, text="Skip up-to-date PDFs", variable=self.skip_up_to_date_var)
+        self.skip_up_to_date_check.grid(row=4, column=2, padx=10, pady=5, sticky="w")
+
         button_frame = tk.Frame(master)
         button_frame.grid(row=5, column=0, columnspan=3, pady=20)
 
@@ -127,22 +145,46 @@ class WordToPdfConverterApp:
         self.status_text.tag_config("orange", foreground="orange")
 
         self.refresh_treeview_display()
+        self._drain_log_queue()
 
     def log_status(self, message, tag=None):
-        self.master.after(0, self._update_status_text, message, tag)
+        """Queues a status message; safe to call from any thread."""
+        self._log_queue.put((message, tag))
 
-    def _update_status_text(self, message, tag):
-        self.status_text.config(state=tk.NORMAL)
-        self.status_text.insert(tk.END, message + "\n", tag)
-        self.status_text.see(tk.END)
-        self.status_text.config(state=tk.DISABLED)
-
-    def _get_treeview_item_data(self, word_full_path, naming_rule):
+    def _drain_log_queue(self):
+        """
+        Moves queued status messages into the status text widget in one batch, shows the
+        latest conversion progress, then reschedules itself on the Tk event loop.
+        """
+        messages = []
+        try:
+            while len(messages) < _LOG_DRAIN_BATCH:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if messages:
+            self.status_text.config(state=tk.NORMAL)
+            for message, tag in messages:
+                self.status_text.insert(tk.END, message + "\n", tag)
+            self.status_text.see(tk.END)
+            self.status_text.config(state=tk.DISABLED)
+
+        progress = self._latest_progress
+        if progress != self._shown_progress:
+            self._shown_progress = progress
+            if progress is not None:
+                self._show_conversion_progress(*progress)
+
+        self.master.after(_LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+
+    def _get_treeview_item_data(self, word_full_path, namer):
         """
         Helper to get the data for a Treeview row (Original Word, Converted PDF).
+        'namer' is a naming function from WordConverterLogic.resolve_namer.
         """
         word_basename = os.path.basename(word_full_path)
-        pdf_filename = self.converter_logic.get_pdf_filename(word_full_path, naming_rule)
+        pdf_filename = namer(os.path.splitext(word_basename)[0])
         
         return (word_basename, pdf_filename)
 
@@ -154,11 +196,11 @@ class WordToPdfConverterApp:
         for item in self.word_treeview.get_children():
             self.word_treeview.delete(item)
         
-        current_naming_rule = self.naming_rule_var.get()
+        namer = self.converter_logic.resolve_namer(self.naming_rule_var.get())
         temp_selected_word_files_data = []
         for item_data in self.selected_word_files_data:
             word_path = item_data['path']
-            original_word_name, converted_pdf_name = self._get_treeview_item_data(word_path, current_naming_rule)
+            original_word_name, converted_pdf_name = self._get_treeview_item_data(word_path, namer)
             item_id = self.word_treeview.insert("", "end", values=(original_word_name, converted_pdf_name))
             temp_selected_word_files_data.append({'path': word_path, 'treeview_id': item_id})
         self.selected_word_files_data = temp_selected_word_files_data
@@ -191,16 +233,14 @@ class WordToPdfConverterApp:
                     for item_name in os.listdir(f_path):
                         full_item_path = os.path.join(f_path, item_name)
                         if os.path.isfile(full_item_path):
-                            valid_extensions = ('.docx', '.docm', '.doc', '.dotx', '.dotm', '.dot', '.rtf', '.odt')
-                            if full_item_path.lower().endswith(valid_extensions):
+                            if full_item_path.lower().endswith(WORD_EXTENSIONS):
                                 if not any(data['path'] == full_item_path for data in self.selected_word_files_data):
                                     self.selected_word_files_data.append({'path': full_item_path, 'treeview_id': None})
                                     added_count += 1
                             else:
                                 self.log_status(f"Skipping non-Word file in directory: {item_name}", "orange")
                 elif os.path.isfile(f_path): # Handle individual files
-                    valid_extensions = ('.docx', '.docm', '.doc', '.dotx', '.dotm', '.dot', '.rtf', '.odt')
-                    if not f_path.lower().endswith(valid_extensions):
+                    if not f_path.lower().endswith(WORD_EXTENSIONS):
                         self.log_status(f"Skipping non-Word file: {os.path.basename(f_path)}", "orange")
                         continue
 
@@ -309,15 +349,18 @@ class WordToPdfConverterApp:
                 return
         
         selected_naming_rule = self.naming_rule_var.get()
+        skip_up_to_date = self.skip_up_to_date_var.get()
+
+        # Pre-conversion conflict check. The converter decides which sources it would skip,
+        # so sources matched by its manifest are not reported as conflicts.
+        try:
+            conflicting_files = self.batch_converter.find_output_conflicts(
+                word_paths_for_conversion, output_dir, selected_naming_rule, skip_if_newer=skip_up_to_date
+            )
+        except OSError as e:
+            self.log_status(f"Warning: Could not read output directory '{output_dir}' for conflict check: {e}", "orange")
+            conflicting_files = []
 
-        # Pre-conversion conflict check
-        conflicting_files = []
-        for word_path in word_paths_for_conversion:
-            proposed_pdf_filename = self.converter_logic.get_pdf_filename(word_path, selected_naming_rule)
-            potential_output_path = os.path.join(output_dir, proposed_pdf_filename)
-            if os.path.exists(potential_output_path):
-                conflicting_files.append(proposed_pdf_filename)
-        
         if conflicting_files:
             conflict_message = (
                 "The following PDF files already exist in the output directory:\n\n"
@@ -330,6 +373,7 @@ class WordToPdfConverterApp:
                 self.log_status("User cancelled conversion due to detected file conflicts.", "orange")
                 return # Stop conversion
 
+        self._latest_progress = self._shown_progress = None
         self.convert_btn.config(state=tk.DISABLED, text="Converting in progress...", bg="lightgray")
         self.stop_btn.config(state=tk.NORMAL)
         self.add_files_btn.config(state=tk.DISABLED)
@@ -337,13 +381,14 @@ class WordToPdfConverterApp:
         self.remove_selected_btn.config(state=tk.DISABLED)
         self.browse_dir_btn.config(state=tk.DISABLED)
         self.naming_rule_menu.config(state=tk.DISABLED)
+        self.skip_up_to_date_check.config(state=tk.DISABLED)
         self.output_dir_entry.config(state=tk.DISABLED)
         self.word_treeview.config(selectmode="none")
         self.log_status("Starting batch conversion...", "blue")
 
         conversion_thread = threading.Thread(
             target=self._run_conversion_in_thread,
-            args=(list(word_paths_for_conversion), output_dir, selected_naming_rule)
+            args=(list(word_paths_for_conversion), output_dir, selected_naming_rule, skip_up_to_date)
         )
         conversion_thread.daemon = True
         conversion_thread.start()
@@ -362,12 +407,13 @@ class WordToPdfConverterApp:
         self.remove_selected_btn.config(state=tk.NORMAL)
         self.browse_dir_btn.config(state=tk.NORMAL)
         self.naming_rule_menu.config(state=tk.NORMAL)
+        self.skip_up_to_date_check.config(state=tk.NORMAL)
         self.output_dir_entry.config(state=tk.NORMAL)
         self.word_treeview.config(selectmode="extended")
         self.log_status("Conversion stop signal sent. Waiting for workers to finish current tasks.", "orange")
 
 
-    def _run_conversion_in_thread(self, word_file_list, output_dir, naming_rule):
+    def _run_conversion_in_thread(self, word_file_list, output_dir, naming_rule, skip_if_newer=False):
         """
         Wrapper function to run the conversion logic in a separate thread.
         It calls the BatchConverter and then schedules the final GUI update.
@@ -375,7 +421,8 @@ class WordToPdfConverterApp:
         converted_count, failed_count, total_files = 0, 0, 0
         try:
             final_results, converted_count, failed_count, total_files = self.batch_converter.convert_batch_threaded(
-                word_file_list, output_dir, naming_rule
+                word_file_list, output_dir, naming_rule, skip_if_newer=skip_if_newer,
+                progress_callback=self._report_conversion_progress
             )
         except Exception as e:
             self.log_status(f"An unexpected error occurred during conversion: {e}", "red")
@@ -383,6 +430,20 @@ class WordToPdfConverterApp:
         finally:
             self.master.after(0, self._conversion_complete, final_results, converted_count, failed_count, total_files)
 
+    def _report_conversion_progress(self, result, completed, total):
+        """
+        Called by BatchConverter as each file finishes. Only stores the count; the log drain
+        timer shows it on the Tk thread, so a fast batch does not flood the event loop.
+        """
+        self._latest_progress = (completed, total)
+
+    def _show_conversion_progress(self, completed, total):
+        """
+        Shows how many files are done on the convert button while a conversion is running.
+        """
+        if str(self.stop_btn["state"]) == tk.NORMAL:
+            self.convert_btn.config(text=f"Converting in progress... ({completed}/{total})")
+
     def _conversion_complete(self, final_results, converted_count, failed_count, total_files):
         """
         This method is called on the main Tkinter thread after the conversion thread finishes.
@@ -393,11 +454,13 @@ class WordToPdfConverterApp:
         
         self.refresh_treeview_display() 
 
+        skipped_count = sum(1 for item in final_results if item.get("status") == "Skipped")
         final_message = (
             f"Batch conversion complete!\n"
             f"Successfully converted: {converted_count} file(s)\n"
             f"Failed: {failed_count} file(s)\n" 
-            f"Total: {total_files} file(s)"
+            + (f"Skipped (up-to-date): {skipped_count} file(s)\n" if skipped_count else "")
+            + f"Total: {total_files} file(s)"
         )
         self.log_status(final_message, "blue")
 
@@ -414,6 +477,7 @@ class WordToPdfConverterApp:
         self.remove_selected_btn.config(state=state)
         self.browse_dir_btn.config(state=state)
         self.naming_rule_menu.config(state=state)
+        self.skip_up_to_date_check.config(state=state)
         self.output_dir_entry.config(state=state)
         
         if state == tk.NORMAL:
@@ -458,9 +522,11 @@ class WordToPdfConverterApp:
         success_count = 0
         failed_count = 0
         renamed_count = 0
+        skipped_count = 0
         
         failed_items = []
         renamed_items = []
+        skipped_items = []
         success_items = []
 
         for item in results:
@@ -470,6 +536,9 @@ class WordToPdfConverterApp:
             if status == "Failed":
                 failed_count += 1
                 failed_items.append(item)
+            elif status == "Skipped":
+                skipped_count += 1
+                skipped_items.append(item)
             elif renamed:
                 renamed_count += 1
                 # Modify status for display in summary
@@ -489,7 +558,8 @@ class WordToPdfConverterApp:
         tk.Label(summary_counts_frame, text=f"Total Files: {len(results)}", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w")
         tk.Label(summary_counts_frame, text=f"Success: {success_count}", fg="#008000", font=("Arial", 10, "bold")).grid(row=0, column=1, sticky="w")
         tk.Label(summary_counts_frame, text=f"Failed: {failed_count}", fg="#FF0000", font=("Arial", 10, "bold")).grid(row=0, column=2, sticky="w")
-        tk.Label(summary_counts_frame, text=f"Conflict Renamed: {renamed_count}", fg="#FF8C00", font=("Arial", 10, "bold")).grid(row=1, column=0, columnspan=3, sticky="w") # Updated orange color
+        tk.Label(summary_counts_frame, text=f"Conflict Renamed: {renamed_count}", fg="#FF8C00", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w") # Updated orange color
+        tk.Label(summary_counts_frame, text=f"Skipped (Up-to-date): {skipped_count}", fg="#808080", font=("Arial", 10, "bold")).grid(row=1, column=1, columnspan=2, sticky="w")
 
 
         tree_frame = tk.Frame(summary_window)
@@ -525,14 +595,18 @@ class WordToPdfConverterApp:
         summary_tree.tag_configure("green", foreground="#008000")
         summary_tree.tag_configure("red", foreground="#FF0000")
         summary_tree.tag_configure("orange", foreground="#FF8C00") # Darker Orange (DarkOrange)
+        summary_tree.tag_configure("gray", foreground="#808080")
 
-        # Insert items in sorted order: Failed, Renamed, Success
+        # Insert items in sorted order: Failed, Renamed, Skipped, Success
         for item in failed_items:
             summary_tree.insert("", "end", values=(item.get("original_filename", "N/A"), item.get("output_filename", "N/A"), item.get("status", "Unknown")), tags=("red",))
         
         for item in renamed_items:
             summary_tree.insert("", "end", values=(item.get("original_filename", "N/A"), item.get("output_filename", "N/A"), item.get("status", "Unknown")), tags=("orange",))
 
+        for item in skipped_items:
+            summary_tree.insert("", "end", values=(item.get("original_filename", "N/A"), item.get("output_filename", "N/A"), item.get("status", "Unknown")), tags=("gray",))
+
         for item in success_items:
             summary_tree.insert("", "end", values=(item.get("original_filename", "N/A"), item.get("output_filename", "N/A"), item.get("status", "Unknown")), tags=("green",))
         
@@ -560,7 +634,27 @@ class WordToPdfConverterApp:
                 self._set_main_controls_state(tk.NORMAL)
                 self.convert_btn.config(state=tk.NORMAL, text="Start Batch Conversion", bg="lightblue")
                 self.stop_btn.config(state=tk.DISABLED)
-                self.master.destroy()
+                self._shutdown_and_close()
+        else:
+            self._shutdown_and_close()
+
+    def _shutdown_and_close(self):
+        """
+        Hides the main window, shuts the converter down on a background thread and destroys
+        the window once it is done. shutdown() waits for each worker's current export to
+        finish, which must not freeze the Tk event loop.
+        """
+        self.master.withdraw()
+        shutdown_thread = threading.Thread(target=self.batch_converter.shutdown, daemon=True)
+        shutdown_thread.start()
+        self._destroy_after_shutdown(shutdown_thread)
+
+    def _destroy_after_shutdown(self, shutdown_thread):
+        """
+        Destroys the main window once the converter's shutdown thread has finished.
+        """
+        if shutdown_thread.is_alive():
+            self.master.after(_SHUTDOWN_POLL_INTERVAL_MS, self._destroy_after_shutdown, shutdown_thread)
         else:
             self.master.destroy()
 
@@ -1,11 +1,163 @@
 import os
+import functools
+import atexit
+import json
 import win32com.client
+from win32com.client import gencache
 import pythoncom
 import re
+import shutil
 import sys
 import threading
 import queue
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_WS_RE = re.compile(r'\s+')
+_PDF_EXT = ".pdf"
+# A PDF already renamed due to a collision, e.g. "report (3).pdf" (matched against lower-cased names).
+_NUMBERED_PDF_RE = re.compile(r'^(.*) \((\d+)\)\.pdf$')
+
+# Source file extensions Word can open for conversion (lower case). Also used by the GUI.
+WORD_EXTENSIONS = ('.docx', '.docm', '.doc', '.dotx', '.dotm', '.dot', '.rtf', '.odt')
+
+
+def _original_pdf_name(base_name):
+    """Naming rule "Original Name": the WORD file's base name with a .pdf extension."""
+    return base_name + _PDF_EXT
+
+
+def _bracket_free_pdf_name(base_name):
+    """Naming rule "Remove Square Brackets": drops [...] segments and collapses whitespace."""
+    cleaned_base_name = _WS_RE.sub(' ', _BRACKET_RE.sub('', base_name)).strip()
+    if not cleaned_base_name:
+        cleaned_base_name = "Untitled_Document"
+    return cleaned_base_name + _PDF_EXT
+
+
+# Naming rule name -> naming function, resolved once per batch by WordConverterLogic.resolve_namer.
+_NAMERS = {
+    "Original Name": _original_pdf_name,
+    "Remove Square Brackets": _bracket_free_pdf_name,
+}
+
+# Microsoft Word Object Library: (typelib CLSID, LCID, major, minor). 8.4 is Word 2007;
+# newer installs register a higher minor version which is picked up automatically.
+_WORD_TYPELIB = ("{00020905-0000-0000-C000-000000000046}", 0, 8, 4)
+
+@functools.lru_cache(maxsize=None)
+def _word_clsid():
+    """
+    Returns Word.Application's CLSID. The ProgID is looked up in the registry on first use
+    only; a failed lookup (Word not installed) is not cached and raises again next time.
+    """
+    return pythoncom.ProgIDToCLSID("Word.Application")
+
+# Application-wide Word options overridden while a worker owns its Word instance, to skip
+# field/link updates and background repagination at print/export. Word persists Options
+# to the user's profile, so workers restore the original values before quitting; only
+# options that change export cost are overridden, since an abandoned instance never
+# restores them.
+_WORD_OPTION_OVERRIDES = {
+    "UpdateFieldsAtPrint": False,
+    "UpdateLinksAtPrint": False,
+    "Pagination": False,
+}
+
+# How many times a task is handed back to the queue after a worker fails to launch Word,
+# before it is recorded as failed. Bounds the batch time when Word is broken system-wide.
+_MAX_LAUNCH_RETRIES = 2
+
+# Queued in place of a task to make one idle worker leave the pool (and quit its Word instance)
+# when a batch asks for fewer workers than are running. None is the shutdown sentinel.
+_RETIRE_WORKER = object()
+
+# A worker quits and relaunches its Word instance after opening this many documents. Word's
+# memory use grows with every document it opens, and instances are kept across batches.
+_WORD_RECYCLE_INTERVAL = 100
+
+# Documents.Open arguments shared by every source document. None of them may bring up a
+# dialog: nobody can answer it in a headless worker, so it would hang until the timeout.
+_DOCUMENT_OPEN_OPTIONS = {
+    "ReadOnly": True,
+    "ConfirmConversions": False, # No converter picker for non-.docx sources
+    "AddToRecentFiles": False,
+    "Visible": False, # No document window
+    "OpenAndRepair": False, # Fail corrupt documents instead of attempting a slow repair
+    "NoEncodingDialog": True, # No encoding picker for documents Word cannot identify
+}
+
+# Document.ExportAsFixedFormat arguments shared by every export. ExportAsFixedFormat is the
+# narrow PDF emitter: unlike SaveAs it leaves the document's FullName, dirty state and the
+# recent-files list alone.
+_PDF_EXPORT_OPTIONS = {
+    "ExportFormat": 17, # wdExportFormatPDF
+    "OpenAfterExport": False,
+    "OptimizeFor": 0, # wdExportOptimizeForPrint
+    "Range": 0, # wdExportAllDocument
+    "Item": 0, # wdExportDocumentContent
+    "IncludeDocProps": False,
+    "KeepIRM": False,
+    "CreateBookmarks": 0, # wdExportCreateNoBookmarks
+    "DocStructureTags": False,
+    "BitmapMissingFonts": True, # Word's default: bitmap text whose font cannot be embedded
+    "UseISO19005_1": False,
+}
+
+# Longest source or output path handed to Word. Word does not accept long-path (\\?\) names,
+# so longer paths are failed up front instead of after a slow Documents.Open/export attempt.
+_MAX_PATH_LENGTH = 255
+
+# Extra hints appended to COM error messages, keyed by signed 32-bit HRESULT/SCODE.
+_COM_ERROR_HINTS = {
+    -2147024864: "Possible cause: The file is currently in use or locked by another application (e.g., another Word instance). Please close the file and try again.", # 0x80070020
+    -2147024741: "Possible cause: The path (source or destination) might be too long or invalid.", # 0x8007009B
+}
+
+
+def _signed_hresult(code):
+    """Normalizes an HRESULT reported as an unsigned 32-bit value to its signed form."""
+    return code - 0x100000000 if code >= 0x80000000 else code
+
+
+# ANSI colours for console logging when no log_callback is given.
+_ANSI_COLORS = {
+    "blue": "\033[94m",
+    "orange": "\033[93m",
+    "green": "\033[92m",
+    "red": "\033[91m",
+}
+_ANSI_RESET = "\033[0m"
+
+# Verbosity of each log tag: 0 = errors, 1 = warnings, 2 = progress/info.
+# Messages whose level exceeds the converter's log_level are dropped before formatting or queuing.
+_LOG_LEVELS = {"red": 0, "orange": 1, "blue": 2, "green": 2}
+
+# A document whose export runs longer than this is treated as hung: the batch records it as
+# failed and replaces the worker, whose Word instance quits once the call finally returns.
+_DOCUMENT_TIMEOUT = 600
+# How often a waiting batch checks for hung documents, in seconds.
+_WATCHDOG_INTERVAL = 1.0
+
+# How long shutdown() waits for each worker to finish its current document and quit Word.
+_SHUTDOWN_JOIN_TIMEOUT = 30
+
+# Cap on the default worker count. Each worker runs its own Word process (a few hundred MB
+# of RAM), so past this point extra instances mostly compete for memory and disk.
+_MAX_DEFAULT_WORKERS = 8
+
+# Manifest kept in the output directory when skipping up-to-date PDFs. It maps each source file
+# (absolute path, mtime, size) to the PDF it produced, so re-runs also recognise PDFs that were
+# renamed due to collisions.
+_MANIFEST_FILENAME = ".w2pdf_cache.json"
+
+# Read size used when pre-reading upcoming source files into the OS file cache.
+_READAHEAD_CHUNK_SIZE = 1024 * 1024
+
+# Upper bound on concurrent source-directory scans when validating source files (helps on network shares).
+_STAT_WORKERS = 32
 
 class WordConverterLogic:
     """
@@ -31,15 +183,7 @@ class WordConverterLogic:
         if self._log_callback:
             self._log_callback(message, tag)
         else:
-            color_map = {
-                "blue": "\033[94m",
-                "orange": "\033[93m",
-                "green": "\033[92m",
-                "red": "\033[91m",
-                "reset": "\033[0m"
-            }
-            colored_message = f"{color_map.get(tag, '')}{message}{color_map['reset']}"
-            print(colored_message)
+            print(f"{_ANSI_COLORS.get(tag, '')}{message}{_ANSI_RESET}")
 
     def get_pdf_filename(self, word_path, naming_rule):
         """
@@ -55,77 +199,173 @@ class WordConverterLogic:
             str: The calculated filename for the output PDF.
         """
         base_name = os.path.splitext(os.path.basename(word_path))[0]
+        return self.resolve_namer(naming_rule)(base_name)
 
-        if naming_rule == "Original Name":
-            return f"{base_name}.pdf"
-        elif naming_rule == "Remove Square Brackets":
-            cleaned_base_name = re.sub(r'\[.*?\]', '', base_name)
-            cleaned_base_name = re.sub(r'\s+', ' ', cleaned_base_name).strip()
-            if not cleaned_base_name:
-                cleaned_base_name = "Untitled_Document"
-            return f"{cleaned_base_name}.pdf"
-        else:
+    def resolve_namer(self, naming_rule):
+        """
+        Resolves a naming rule once into a function that maps a WORD file's base name
+        (filename without directory or extension) to its intended PDF filename. Use this
+        instead of get_pdf_filename when naming many files with the same rule; an unknown
+        rule is reported once here instead of once per file.
+
+        Args:
+            naming_rule (str): The selected naming rule (e.g., "Original Name", "Remove Square Brackets").
+
+        Returns:
+            callable: A function taking a base name and returning the PDF filename.
+        """
+        namer = _NAMERS.get(naming_rule)
+        if namer is None:
             self._log(f"Warning: Unknown naming rule '{naming_rule}'. Using 'Original Name' as fallback.", "orange")
-            return f"{base_name}.pdf"
+            namer = _original_pdf_name
+        return namer
+
+
+class _AtomicCounter:
+    """
+    A thread-safe integer counter shared between worker threads.
+    """
+    def __init__(self, value=0):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def increment(self, amount=1):
+        """
+        Adds amount to the counter and returns the new value.
+        """
+        with self._lock:
+            self._value += amount
+            return self._value
+
+    def decrement(self, amount=1):
+        """
+        Subtracts amount from the counter and returns the new value.
+        """
+        return self.increment(-amount)
+
+    @property
+    def value(self):
+        return self._value
+
+
+class _BatchContext:
+    """
+    Per-batch state shared with the persistent worker pool. Every queued task carries
+    a reference to the batch it belongs to, so workers can outlive individual batches.
+    """
+    def __init__(self, size):
+        # Indices are dense (0..size-1), so results go straight into their input slot.
+        # Only the thread running the batch writes 'results'; everyone else posts to 'result_queue'.
+        self.results = [None] * size
+        self.result_queue = queue.SimpleQueue()
+        self.started = _AtomicCounter(0)
+        self.done = threading.Event()
+
+    def record_result(self, original_index, result):
+        """
+        Hands a task's result to the thread running the batch. Safe to call from any thread.
+        """
+        self.result_queue.put((original_index, result))
+
 
 class ConversionWorker(threading.Thread):
     """
     A worker thread that converts WORD files to PDF using its own Word Application instance.
+    Workers are kept alive by BatchConverter across batches, so the Word instance is launched
+    once and reused until BatchConverter.shutdown() is called.
     """
-    def __init__(self, worker_id, task_queue, results_dict, shared_tracker, tracker_lock, output_dir, naming_rule, log_callback, stop_event):
-        super().__init__()
+    def __init__(self, worker_id, task_queue, live_workers, log_callback, stop_event, log_level=2):
+        super().__init__(daemon=True)
         self.worker_id = worker_id
+        self._log_prefix = f"[Worker {worker_id}] "
         self.task_queue = task_queue
-        self.results_dict = results_dict
-        self.shared_tracker = shared_tracker
-        self.tracker_lock = tracker_lock
-        self.output_dir = output_dir
-        self.naming_rule = naming_rule
+        self.live_workers = live_workers
         self.log_callback = log_callback
         self.stop_event = stop_event
+        self.log_level = log_level
         self.word_app = None
-        self.logic = WordConverterLogic(log_callback=self._log)
+        self._saved_word_options = {}
+        self._documents_since_launch = 0
+        self._left_pool = False
+        self._pool_lock = threading.Lock()
+        # Read by BatchConverter's watchdog; set while a document is being exported.
+        self.current_task = None
+        self.busy_since = None
+        self.abandoned = False
+
+    def _leave_pool(self):
+        """
+        Takes this worker out of the live worker count, exactly once, whichever of the worker
+        and the watchdog gets there first. Returns the number of live workers left, or None
+        if this worker had already left the pool.
+        """
+        with self._pool_lock:
+            if self._left_pool:
+                return None
+            self._left_pool = True
+            return self.live_workers.decrement()
+
+    def abandon(self):
+        """
+        Called by BatchConverter's watchdog when this worker's export has hung. Takes the worker
+        out of the pool; it exits (and quits its Word instance) if the call ever returns.
+        Returns False if the worker had already left the pool.
+        """
+        if self._leave_pool() is None:
+            return False
+        self.abandoned = True
+        return True
 
     def _log(self, message, tag=None):
         """
         Internal logging method for the worker, prepends worker ID.
         """
+        if _LOG_LEVELS.get(tag, 2) > self.log_level:
+            return
         if self.log_callback:
-            self.log_callback(f"[Worker {self.worker_id}] {message}", tag)
+            self.log_callback(self._log_prefix + message, tag)
         else:
-            color_map = {
-                "blue": "\033[94m",
-                "orange": "\033[93m",
-                "green": "\033[92m",
-                "red": "\033[91m",
-                "reset": "\033[0m"
-            }
-            colored_message = f"{color_map.get(tag, '')}[Worker {self.worker_id}] {message}{color_map['reset']}"
-            print(colored_message)
+            print(f"{_ANSI_COLORS.get(tag, '')}{self._log_prefix}{message}{_ANSI_RESET}")
 
     def run(self):
         """
         Main execution loop for the worker thread.
         """
-        pythoncom.CoInitialize() 
+        # Multithreaded apartment: Word is out-of-process, so every call goes through a proxy
+        # either way, and an MTA thread waits on it without running an STA message pump.
+        # The worker still creates, uses and quits its own Word instance on this thread.
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
         self._log("Starting worker.", "blue")
+        # Loop-invariant lookups bound once. Documents.Open is deliberately not cached:
+        # the Word instance can be relaunched mid-loop.
+        get_task = self.task_queue.get
+        task_done = self.task_queue.task_done
+        stop_requested = self.stop_event.is_set
+        log = self._log
+        com_error = pythoncom.com_error
+        last_batch = None
         try:
-            while True:
-                if self.stop_event.is_set():
-                    self._log("Stop signal received. Exiting worker.", "blue")
+            while not self.abandoned:
+                task = get_task() # Blocks until a task or the shutdown sentinel arrives
+                if task is None:
+                    task_done()
                     break
-
-                task = None
-                try:
-                    task = self.task_queue.get(timeout=0.1) 
-                except queue.Empty:
-                    self._log("Queue is empty, no more tasks. Exiting worker.", "blue")
+                if task is _RETIRE_WORKER:
+                    with self._pool_lock:
+                        self._left_pool = True # BatchConverter already took it out of the live count
+                    task_done()
                     break
 
+                batch = task["batch"]
+                batch.started.increment()
                 original_index = task["original_index"]
                 word_path = task["word_path"]
-                original_filename = os.path.basename(word_path)
-                
+                abs_word_path = task["abs_word_path"]
+                original_filename = task["original_filename"]
+                final_pdf_full_path = task["pdf_full_path"]
+                final_pdf_filename = task["pdf_filename"]
+                renamed = task["renamed"]
+
                 result = {
                     "original_index": original_index,
                     "original_filename": original_filename,
@@ -138,231 +378,787 @@ class ConversionWorker(threading.Thread):
                 }
 
                 try:
-                    if self.stop_event.is_set():
-                        self._log(f"Stop signal received, marking '{original_filename}' as failed (conversion stopped).", "orange")
+                    if stop_requested():
+                        log(f"Stop signal received, marking '{original_filename}' as failed (conversion stopped).", "orange")
                         result["message"] = "Conversion stopped by user."
                         continue
 
-                    if self.word_app is None:
-                        try:
-                            self.word_app = win32com.client.DispatchEx("Word.Application")
-                            self.word_app.Visible = False
-                            self._log("Launched a new, isolated Word Application instance.", "blue")
-                        except Exception as e:
-                            error_msg = f"Could not launch Word Application instance. Please ensure MS Word is installed and not corrupted. Details: {e}"
-                            self._log(error_msg, "red")
+                    # The Word instance is kept between batches and may have been closed or crashed
+                    # while idle. Check once per batch, before paying for a doomed Documents.Open.
+                    if batch is not last_batch:
+                        last_batch = batch
+                        if self.word_app is not None and not self._word_app_alive():
+                            log("Word Application instance stopped responding while idle. Relaunching it.", "orange")
+                            self._discard_word()
+
+                    launching_word = self.word_app is None
+                    try:
+                        self._ensure_word()
+                    except Exception as e:
+                        error_msg = f"Could not launch Word Application instance. Please ensure MS Word is installed and not corrupted. Details: {e}"
+                        log(error_msg, "red")
+                        # This worker cannot convert anything, so it leaves the pool. The task is
+                        # handed back for another worker unless retries or workers have run out.
+                        remaining_workers = self._leave_pool() or 0
+                        attempts = task.get("attempts", 0)
+                        if attempts < _MAX_LAUNCH_RETRIES and remaining_workers > 0:
+                            log(f"Handing '{original_filename}' back to the queue for another worker.", "orange")
+                            self.task_queue.put({**task, "attempts": attempts + 1})
+                            result = None
+                        else:
                             result["message"] = error_msg
-                            with self.tracker_lock:
-                                self.results_dict[original_index] = result
-                            continue
-                    
-                    if self.stop_event.is_set():
-                        self._log(f"Stop signal received, marking '{original_filename}' as failed (conversion stopped).", "orange")
+                        break
+
+                    # Launching Word takes seconds; otherwise the check above is only microseconds old.
+                    if launching_word and stop_requested():
+                        log(f"Stop signal received, marking '{original_filename}' as failed (conversion stopped).", "orange")
                         result["message"] = "Conversion stopped by user."
                         continue
 
-                    doc = None
                     try:
-                        if not os.path.exists(word_path):
-                            error_msg = f"Source file does not exist: '{original_filename}'"
-                            self._log(error_msg, "red")
-                            result["message"] = error_msg
-                            raise FileNotFoundError(error_msg)
+                        log(f"Processing '{original_filename}' -> '{final_pdf_filename}'", "orange")
+                        self.current_task = task
+                        self.busy_since = time.monotonic()
+                        self._documents_since_launch += 1
 
-                        proposed_pdf_filename = self.logic.get_pdf_filename(word_path, self.naming_rule)
-                        
-                        final_pdf_full_path, renamed = self._get_unique_pdf_path_thread_safe(
-                            self.output_dir, proposed_pdf_filename, self.shared_tracker, self.tracker_lock
-                        )
-                        
-                        final_pdf_filename = os.path.basename(final_pdf_full_path)
-
-                        if len(final_pdf_full_path) > 255:
-                            error_msg = (
-                                f"Output PDF path is too long ({len(final_pdf_full_path)} characters). "
-                                f"Windows path limit is typically 255-260 characters. "
-                                f"Please shorten the output directory path or the original filename: '{final_pdf_full_path}'"
-                            )
-                            self._log(error_msg, "red")
-                            result["output_filename"] = final_pdf_filename
-                            result["message"] = "Path exceeds 255 chars. Shorten."
-                            continue
-
-                        self._log(f"Processing '{original_filename}' -> '{final_pdf_filename}'", "orange")
-
-                        doc = self.word_app.Documents.Open(
-                            os.path.abspath(word_path),
-                            ReadOnly=True,
-                            ConfirmConversions=False,
-                            AddToRecentFiles=False
-                        )
-
-                        doc.SaveAs(final_pdf_full_path, FileFormat=17)
-                        doc.Close(False)
-                        doc = None
+                        try:
+                            self._export_pdf(abs_word_path, final_pdf_full_path)
+                        except com_error:
+                            if self._word_app_alive():
+                                raise
+                            # The reused Word instance died (crashed or was closed externally)
+                            log("Word Application instance stopped responding. Relaunching it and retrying.", "orange")
+                            self._discard_word()
+                            self._ensure_word()
+                            self._export_pdf(abs_word_path, final_pdf_full_path)
                         
                         result["status"] = "Success"
                         result["output_filename"] = final_pdf_filename
                         result["output_path"] = final_pdf_full_path
                         result["renamed_due_to_collision"] = renamed
                         result["message"] = "Successfully converted." + (" (Renamed due to collision)" if renamed else "")
-                        self._log(f"Successfully converted: '{original_filename}' -> '{final_pdf_filename}'", "green")
+                        log(f"Successfully converted: '{original_filename}' -> '{final_pdf_filename}'", "green")
 
-                    except pythoncom.com_error as com_e:
+                    except com_error as com_e:
                         error_message = f"Conversion of '{original_filename}' failed due to COM error: {com_e}"
-                        if hasattr(com_e, 'ex_info') and com_e.ex_info and len(com_e.ex_info) > 1:
-                            com_error_description = com_e.ex_info[1]
-                            com_error_scode = com_e.ex_info[4]
-                            error_message += f"\nDetails: {com_error_description} (HRESULT: {hex(com_error_scode)})"
-                            if com_error_scode == -2147024864:
-                                error_message += "\nPossible cause: The file is currently in use or locked by another application (e.g., another Word instance). Please close the file and try again."
-                            elif com_error_scode == -2147024741:
-                                error_message += "\nPossible cause: The path (source or destination) might be too long or invalid."
-                        self._log(error_message, "red")
+                        # pywin32 excepinfo: (wCode, source, description, helpFile, helpContext, scode)
+                        excepinfo = getattr(com_e, 'excepinfo', None)
+                        if excepinfo and len(excepinfo) > 5:
+                            com_error_description = excepinfo[2]
+                            com_error_scode = _signed_hresult(excepinfo[5] or com_e.hresult)
+                            error_message += f"\nDetails: {com_error_description} (HRESULT: 0x{com_error_scode & 0xFFFFFFFF:08X})"
+                            hint = _COM_ERROR_HINTS.get(com_error_scode)
+                            if hint:
+                                error_message += "\n" + hint
+                        log(error_message, "red")
                         result["message"] = error_message
-                        if doc:
-                            try:
-                                doc.Close(False)
-                            except Exception as close_e:
-                                self._log(f"Error closing document after failed COM conversion: {close_e}", "red")
 
                     except Exception as e:
                         error_message = f"Conversion of '{original_filename}' failed: {e}"
-                        self._log(error_message, "red")
+                        log(error_message, "red")
                         result["message"] = error_message
-                        if doc:
-                            try:
-                                doc.Close(False)
-                            except Exception as close_e:
-                                self._log(f"Error closing document after failed general conversion: {close_e}", "red")
 
                 finally:
-                    with self.tracker_lock:
-                        self.results_dict[original_index] = result
-                    self.task_queue.task_done()
+                    self.current_task = None
+                    self.busy_since = None
+                    if result is not None:
+                        batch.record_result(original_index, result)
+                    if self._left_pool and not self.abandoned and self.live_workers.value <= 0:
+                        batch.done.set() # Nobody is left to process the rest of the queue
+                    if self.word_app is not None and self._documents_since_launch >= _WORD_RECYCLE_INTERVAL:
+                        log(f"Recycling Word Application instance after {self._documents_since_launch} documents.", "blue")
+                        self._quit_word() # The next task launches a fresh instance
+                    task_done()
 
         finally:
+            self._leave_pool()
             if self.word_app:
-                try:
-                    self.word_app.Quit() 
-                    del self.word_app 
-                    self._log("Word Application quit and COM object released.", "blue")
-                except Exception as e:
-                    self._log(f"Error quitting Word application: {e}", "red")
+                self._quit_word()
             
             pythoncom.CoUninitialize()
 
+    def _quit_word(self):
+        """
+        Restores the Word options changed by this worker, quits its Word instance and
+        releases the COM object.
+        """
+        try:
+            self._restore_word_options()
+            self.word_app.Quit()
+            self._log("Word Application quit and COM object released.", "blue")
+        except Exception as e:
+            self._log(f"Error quitting Word application: {e}", "red")
+        finally:
+            self._discard_word()
 
-    def _get_unique_pdf_path_thread_safe(self, output_dir, proposed_pdf_filename, shared_tracker, tracker_lock):
+    def _ensure_word(self):
         """
-        Generates a unique PDF path, checking both disk existence and
-        names proposed by other threads in the current batch.
-        Returns the unique path and a boolean indicating if it was renamed.
+        Launches and configures this worker's Word instance if it is not running yet.
+        Raises if Word cannot be launched.
         """
-        base_name, ext = os.path.splitext(proposed_pdf_filename)
-        
-        renamed = False
-        
-        while True:
-            current_counter = 0
-            with tracker_lock:
-                current_counter = shared_tracker.get(base_name, 0)
-                
-                if current_counter == 0:
-                    unique_filename = proposed_pdf_filename
-                else:
-                    unique_filename = f"{base_name} ({current_counter}){ext}"
-                    renamed = True
+        if self.word_app is not None:
+            return
+        # Same as DispatchEx("Word.Application") (a new, isolated instance, early-bound if
+        # the makepy wrapper exists) without resolving the ProgID on every launch.
+        self.word_app = win32com.client.Dispatch(pythoncom.CoCreateInstance(
+            _word_clsid(), None, pythoncom.CLSCTX_LOCAL_SERVER, pythoncom.IID_IDispatch
+        ))
+        self.word_app.Visible = False
+        self.word_app.DisplayAlerts = 0 # wdAlertsNone
+        self.word_app.ScreenUpdating = False
+        # Don't run AutoOpen/Document_Open macros of .docm/.dotm sources; automation would
+        # otherwise enable them. Session-only, not persisted to the user's profile.
+        self.word_app.AutomationSecurity = 3 # msoAutomationSecurityForceDisable
+        # Fail instead of showing an install-on-demand prompt for a feature that is not installed.
+        self.word_app.FeatureInstall = 0 # msoFeatureInstallNone
+        self._apply_word_options()
+        self._documents_since_launch = 0
+        self._log("Launched a new, isolated Word Application instance.", "blue")
 
-                full_path_candidate = os.path.join(output_dir, unique_filename)
-                path_for_check = os.path.abspath(full_path_candidate)
+    def _word_app_alive(self):
+        """
+        Returns True if this worker's Word instance still answers COM calls.
+        """
+        try:
+            self.word_app.Version
+            return True
+        except Exception:
+            return False
 
-                if os.path.exists(path_for_check):
-                    self._log(f"Path '{path_for_check}' already exists on disk. Incrementing counter and retrying.", "orange")
-                    shared_tracker[base_name] = current_counter + 1
-                    continue
+    def _discard_word(self):
+        """
+        Drops a dead Word instance without trying to quit it, so the next
+        _ensure_word() call launches a fresh one.
+        """
+        self.word_app = None
+        self._saved_word_options = {}
 
-                shared_tracker[base_name] = current_counter + 1
-                break
+    def _export_pdf(self, abs_word_path, pdf_full_path):
+        """
+        Opens a document read-only in this worker's Word instance, exports it to PDF,
+        and closes it again. The document is closed even if the export fails.
+        """
+        doc = self.word_app.Documents.Open(abs_word_path, **_DOCUMENT_OPEN_OPTIONS)
+        try:
+            doc.ExportAsFixedFormat(OutputFileName=pdf_full_path, **_PDF_EXPORT_OPTIONS)
+        finally:
+            try:
+                doc.Close(SaveChanges=0) # wdDoNotSaveChanges
+            except Exception as close_e:
+                self._log(f"Error closing document '{os.path.basename(abs_word_path)}': {close_e}", "red")
+
+    def _apply_word_options(self):
+        """
+        Applies _WORD_OPTION_OVERRIDES to this worker's Word instance, remembering the
+        user's original values so they can be restored before Word quits.
+        """
+        self._saved_word_options = {}
+        for name, value in _WORD_OPTION_OVERRIDES.items():
+            try:
+                self._saved_word_options[name] = getattr(self.word_app.Options, name)
+                setattr(self.word_app.Options, name, value)
+            except Exception as e:
+                self._log(f"Could not set Word option '{name}': {e}", "orange")
 
-        return path_for_check, renamed
+    def _restore_word_options(self):
+        """
+        Restores the Word options changed by _apply_word_options.
+        """
+        for name, value in self._saved_word_options.items():
+            try:
+                setattr(self.word_app.Options, name, value)
+            except Exception as e:
+                self._log(f"Could not restore Word option '{name}': {e}", "orange")
+        self._saved_word_options = {}
 
 
 class BatchConverter:
     """
     Orchestrates the multi-threaded batch conversion of WORD files to PDF.
     """
-    def __init__(self, log_callback=None):
+    def __init__(self, log_callback=None, log_level=2):
+        """
+        Args:
+            log_callback (callable, optional): Called with (message, tag) for each log message.
+                                               Defaults to None, in which case messages are printed to console.
+            log_level (int): 0 = errors only, 1 = errors and warnings, 2 = everything (default).
+        """
         self._log_callback = log_callback
+        self._log_level = log_level
         self._stop_event = threading.Event()
+        self._batch_lock = threading.Lock()
+        self._batch_active = False
         self._workers = []
-        self._task_queue = None
-        self._results_dict = None
-        self._shared_filename_tracker = None
-        self._tracker_lock = None
+        self._live_workers = _AtomicCounter(0)
+        self._next_worker_id = 0
+        self._task_queue = queue.Queue()
+        self._word_early_binding_ready = False
+        self._naming_logic = WordConverterLogic(log_callback=self._log)
+
+        self._log_queue = queue.SimpleQueue()
+        self._log_thread = None
+        self._start_log_thread()
+
+    def _start_log_thread(self):
+        """
+        Starts the logger thread and registers shutdown() with atexit, unless already running.
+        Called on construction and again by a batch started after shutdown().
+        """
+        if self._log_thread is not None:
+            return
+        self._log_thread = threading.Thread(target=self._drain_logs, daemon=True)
+        self._log_thread.start()
+        atexit.register(self.shutdown)
+
+    def _stop_log_thread(self):
+        """
+        Stops the logger thread once every message queued so far has been delivered, and
+        unregisters the atexit hook so the converter can be garbage collected.
+        """
+        log_thread = self._log_thread
+        if log_thread is None:
+            return
+        self._log_queue.put_nowait(None)
+        log_thread.join()
+        self._log_thread = None
+        atexit.unregister(self.shutdown)
+        # Messages queued behind the sentinel; from now on _log delivers directly.
+        try:
+            while True:
+                item = self._log_queue.get_nowait()
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is not None:
+                    self._emit_log(*item)
+        except queue.Empty:
+            pass
 
     def _log(self, message, tag=None):
         """
         Main logging method for the batch converter.
+        Messages are queued and delivered by a dedicated logger thread, so workers
+        never block on the (possibly slow) log callback. Once the logger thread has been
+        stopped by shutdown(), messages are delivered directly.
+        """
+        if _LOG_LEVELS.get(tag, 2) > self._log_level:
+            return
+        if self._log_thread is None:
+            self._emit_log(message, tag)
+            return
+        self._log_queue.put_nowait((message, tag))
+
+    def _drain_logs(self):
+        """
+        Logger thread loop. Delivers queued messages in order and acknowledges
+        flush requests (queued threading.Event objects) once everything before them is out.
+        Exits on a None sentinel queued by _stop_log_thread.
+        """
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self._emit_log(*item)
+            except Exception as e:
+                print(f"Error delivering log message: {e}")
+
+    def _flush_logs(self):
+        """
+        Blocks until every message queued so far has been delivered.
+        """
+        if self._log_thread is None:
+            return
+        flushed = threading.Event()
+        self._log_queue.put_nowait(flushed)
+        flushed.wait()
+
+    def _emit_log(self, message, tag=None):
+        """
+        Delivers a single log message to the callback, or prints it to console.
         """
         if self._log_callback:
             self._log_callback(message, tag)
         else:
-            color_map = {
-                "blue": "\033[94m",
-                "orange": "\033[93m",
-                "green": "\033[92m",
-                "red": "\033[91m",
-                "reset": "\033[0m"
+            print(f"{_ANSI_COLORS.get(tag, '')}{message}{_ANSI_RESET}")
+
+    def _prepare_word_early_binding(self):
+        """
+        Generates (or loads) the makepy wrapper for Word's type library once.
+        Afterwards, each worker still launches an isolated Word instance but
+        returns an early-bound object with cached DISPIDs, so COM calls skip the
+        per-call name lookup. Falls back to late binding if the wrapper cannot be built.
+        """
+        if self._word_early_binding_ready:
+            return
+        self._word_early_binding_ready = True
+
+        pythoncom.CoInitialize()
+        try:
+            if gencache.EnsureModule(*_WORD_TYPELIB) is None:
+                self._log("Word type library not found. Using late-bound COM calls.", "orange")
+        except Exception as e:
+            self._log(f"Could not cache Word type library, using late-bound COM calls instead: {e}", "orange")
+        finally:
+            pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _stat_source(word_path):
+        """
+        Returns the os.stat result for a source file, or None if it does not exist
+        or cannot be accessed.
+        """
+        try:
+            return os.stat(word_path)
+        except OSError:
+            return None
+
+    @classmethod
+    def _stat_sources_in_dir(cls, parent_dir, word_paths):
+        """
+        Returns {word_path: os.stat result or None} for source files that share one parent
+        directory, using a single directory enumeration instead of a stat per file.
+        Falls back to individual stats if the directory cannot be listed.
+        """
+        try:
+            with os.scandir(parent_dir) as entries:
+                entries_by_name = {entry.name.lower(): entry for entry in entries}
+        except OSError:
+            return {word_path: cls._stat_source(word_path) for word_path in word_paths}
+
+        stats = {}
+        for word_path in word_paths:
+            entry = entries_by_name.get(os.path.basename(word_path).lower())
+            try:
+                stats[word_path] = entry.stat() if entry is not None and entry.is_file() else None
+            except OSError:
+                stats[word_path] = None
+        return stats
+
+    @staticmethod
+    def _seed_name_counters(existing_names):
+        """
+        Starts the collision counter of each base name whose PDF already exists after the
+        highest "name (n).pdf" in the output directory, so resolving a new name does not
+        probe past every earlier copy one by one. Keys are lower-cased base names.
+        """
+        counters = {}
+        for name in existing_names:
+            match = _NUMBERED_PDF_RE.match(name)
+            if match:
+                base_key, next_counter = match.group(1), int(match.group(2)) + 1
+                if next_counter > counters.get(base_key, 0):
+                    counters[base_key] = next_counter
+        return {base_key: counter for base_key, counter in counters.items() if base_key + _PDF_EXT in existing_names}
+
+    def _get_unique_pdf_path(self, output_prefix, proposed_pdf_filename, name_counters, existing_names):
+        """
+        Generates a unique PDF path, checking both the snapshot of files already in the
+        output directory and names already assigned in the current batch. Names are compared
+        case-insensitively, matching Windows filesystem semantics. Called only from the
+        producer loop, so no locking is needed.
+        'output_prefix' is the absolute output directory ending with a path separator.
+        Returns the unique path, its filename, and a boolean indicating if it was renamed.
+        """
+        base_name, dot, ext = proposed_pdf_filename.rpartition('.')
+        if dot:
+            ext = dot + ext
+        else:
+            base_name, ext = ext, ''
+
+        base_key = base_name.lower()
+        current_counter = name_counters.get(base_key, 0)
+        unique_filename = proposed_pdf_filename if current_counter == 0 else f"{base_name} ({current_counter}){ext}"
+        unique_key = unique_filename.lower()
+
+        if unique_key in existing_names:
+            first_taken = unique_filename
+            while unique_key in existing_names:
+                current_counter += 1
+                unique_filename = f"{base_name} ({current_counter}){ext}"
+                unique_key = unique_filename.lower()
+            self._log(f"'{first_taken}' already exists in the output directory. Using '{unique_filename}' instead.", "orange")
+
+        name_counters[base_key] = current_counter + 1
+        existing_names.add(unique_key)
+        return output_prefix + unique_filename, unique_filename, current_counter > 0
+
+    def _load_manifest(self, output_dir):
+        """
+        Loads the conversion manifest from the output directory. Returns an empty dict if there
+        is none or it cannot be read.
+        """
+        try:
+            with open(os.path.join(output_dir, _MANIFEST_FILENAME), "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+            return manifest if isinstance(manifest, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self._log(f"Warning: Ignoring unreadable conversion manifest in '{output_dir}': {e}", "orange")
+            return {}
+
+    def _save_manifest(self, output_dir, manifest, final_results, abs_word_paths, source_stats, verified_skips):
+        """
+        Records every successful conversion, and every skip in 'verified_skips' (indices whose
+        PDF was matched by the manifest or claimed by no other source), in the manifest and
+        writes it back to the output directory (via a temporary file, so an interrupted write
+        cannot corrupt it). A PDF belongs to one source only: records of other sources that
+        point to a PDF recorded here are dropped.
+        """
+        recorded = {}
+        for result in final_results:
+            if result["status"] == "Skipped":
+                if result["original_index"] not in verified_skips:
+                    continue
+            elif result["status"] != "Success":
+                continue
+            source_stat = source_stats[result["input_path"]]
+            try:
+                pdf_size = os.stat(result["output_path"]).st_size
+            except OSError:
+                continue
+            source_key = os.path.normcase(abs_word_paths[result["original_index"]])
+            manifest[source_key] = {
+                "mtime_ns": source_stat.st_mtime_ns,
+                "size": source_stat.st_size,
+                "pdf": result["output_filename"],
+                "pdf_size": pdf_size,
             }
-            colored_message = f"{color_map.get(tag, '')}{message}{color_map['reset']}"
-            print(colored_message)
+            recorded[result["output_filename"].lower()] = source_key
+
+        for source_key, record in list(manifest.items()):
+            pdf_key = str(record.get("pdf", "")).lower() if isinstance(record, dict) else None
+            if pdf_key in recorded and recorded[pdf_key] != source_key:
+                del manifest[source_key]
 
-    def _mark_remaining_tasks_as_failed(self):
+        manifest_path = os.path.join(output_dir, _MANIFEST_FILENAME)
+        temp_path = manifest_path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as manifest_file:
+                json.dump(manifest, manifest_file)
+            os.replace(temp_path, manifest_path)
+        except OSError as e:
+            self._log(f"Warning: Could not write conversion manifest in '{output_dir}': {e}", "orange")
+
+    @staticmethod
+    def _manifest_output_entry(record, source_stat, existing_pdf_entries):
         """
-        Marks any tasks still in the queue as failed and updates results_dict.
-        This is called when conversion is explicitly stopped.
+        Returns the DirEntry of the PDF a manifest record points to, if the record still matches
+        the source file (mtime and size) and the PDF is still present with its recorded size.
+        Otherwise returns None.
         """
-        if self._task_queue is not None and self._results_dict is not None and self._tracker_lock is not None:
-            while not self._task_queue.empty():
-                try:
-                    task = self._task_queue.get_nowait()
-                    original_index = task["original_index"]
-                    word_path = task["word_path"]
-                    original_filename = os.path.basename(word_path)
-
-                    self._log(f"Marking '{original_filename}' as failed (conversion stopped before processing).", "orange")
-                    result = {
-                        "original_index": original_index,
-                        "original_filename": original_filename,
-                        "input_path": word_path,
-                        "output_filename": None,
-                        "output_path": None,
-                        "status": "Failed",
-                        "message": "Conversion stopped by user before processing.",
-                        "renamed_due_to_collision": False
-                    }
-                    with self._tracker_lock:
-                        self._results_dict[original_index] = result
-                    self._task_queue.task_done()
-                except queue.Empty:
-                    break 
-                except Exception as e:
-                    self._log(f"Error marking remaining task as failed: {e}", "red")
+        if not isinstance(record, dict):
+            return None
+        if record.get("mtime_ns") != source_stat.st_mtime_ns or record.get("size") != source_stat.st_size:
+            return None
+        existing_entry = existing_pdf_entries.get(str(record.get("pdf", "")).lower())
+        try:
+            if existing_entry is None or existing_entry.stat().st_size != record.get("pdf_size"):
+                return None
+        except OSError:
+            return None
+        return existing_entry
+
+    def _stat_sources(self, word_file_list, abs_word_paths):
+        """
+        Returns {word_path: os.stat result or None} for a batch, with one directory read per
+        distinct source folder (DirEntry.stat() is served from it on Windows).
+        """
+        sources_by_dir = defaultdict(list)
+        for word_path, abs_word_path in zip(word_file_list, abs_word_paths):
+            sources_by_dir[os.path.dirname(abs_word_path)].append(word_path)
+        source_stats = {}
+        with ThreadPoolExecutor(max_workers=min(_STAT_WORKERS, len(sources_by_dir))) as stat_executor:
+            for dir_stats in stat_executor.map(self._stat_sources_in_dir, sources_by_dir.keys(), sources_by_dir.values()):
+                source_stats.update(dir_stats)
+        return source_stats
+
+    @staticmethod
+    def _preflight_error(original_filename, abs_word_path, source_stat):
+        """
+        Returns the reason a source file cannot be converted without opening it in Word,
+        or None if it passes the preflight checks.
+        """
+        if source_stat is None:
+            return "Source file does not exist."
+        if not original_filename.lower().endswith(WORD_EXTENSIONS):
+            return "Not a supported Word document type."
+        if source_stat.st_size == 0:
+            return "Source file is empty (0 bytes)."
+        if len(abs_word_path) > _MAX_PATH_LENGTH:
+            return f"Source path is too long for Word ({len(abs_word_path)} characters). Shorten the folder or file name."
+        return None
+
+    def _up_to_date_matches(self, candidates, existing_pdf_entries, manifest):
+        """
+        Decides which sources the "skip if up-to-date" option skips. 'candidates' holds
+        (original_index, abs_word_path, source_stat, proposed_pdf_filename) tuples in input
+        order. Returns {original_index: DirEntry of the up-to-date PDF}.
+
+        An existing PDF can make only one source "up-to-date". Manifest records are exact, so
+        their PDFs are claimed first; the name/mtime fallback only accepts a PDF no other source
+        of the batch has claimed (lowercased names).
+        """
+        claimed_pdf_names = set()
+        matches = {}
+        if manifest:
+            for i, abs_word_path, source_stat, _ in candidates:
+                existing_entry = self._manifest_output_entry(
+                    manifest.get(os.path.normcase(abs_word_path)), source_stat, existing_pdf_entries
+                )
+                if existing_entry is not None and existing_entry.name.lower() not in claimed_pdf_names:
+                    claimed_pdf_names.add(existing_entry.name.lower())
+                    matches[i] = existing_entry
+
+        for i, _, source_stat, proposed_pdf_filename in candidates:
+            proposed_key = proposed_pdf_filename.lower()
+            if i in matches or proposed_key in claimed_pdf_names:
+                continue
+            existing_entry = existing_pdf_entries.get(proposed_key)
+            try:
+                if existing_entry is not None and existing_entry.stat().st_mtime >= source_stat.st_mtime:
+                    claimed_pdf_names.add(proposed_key)
+                    matches[i] = existing_entry
+            except OSError:
+                pass # The PDF vanished; the source is converted (and renamed if needed)
+        return matches
+
+    def _read_ahead_sources(self, batch, abs_word_paths, depth):
+        """
+        Reads upcoming source files into the OS file cache while workers are busy exporting,
+        staying at most 'depth' files ahead of the files workers have picked up. Workers take
+        tasks in queue order, so the first 'depth' files are being opened already and are skipped.
+        Runs on its own daemon thread and ends with the batch.
+        """
+        for index in range(depth, len(abs_word_paths)):
+            while index >= batch.started.value + depth:
+                if batch.done.wait(0.05):
+                    return
+            if batch.done.is_set() or self._stop_event.is_set():
+                return
+            try:
+                with open(abs_word_paths[index], "rb") as source_file:
+                    while source_file.read(_READAHEAD_CHUNK_SIZE):
+                        pass
+            except OSError:
+                pass # Word reports the real error when it opens the file
+
+    def _mark_remaining_tasks_as_failed(self, message="Conversion stopped by user before processing."):
+        """
+        Marks any tasks still in the queue as failed and posts the results to their batch.
+        This is called when conversion is stopped, or when no worker is left that could
+        process them (e.g. none was able to launch Word). Shutdown and retire sentinels are put back.
+        """
+        drained = []
+        try:
+            while True:
+                drained.append(self._task_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        tasks_by_batch = defaultdict(list)
+        sentinels = []
+        for task in drained:
+            if task is None or task is _RETIRE_WORKER:
+                sentinels.append(task)
+            else:
+                tasks_by_batch[task["batch"]].append(task)
+
+        for batch, tasks in tasks_by_batch.items():
+            for task in tasks:
+                batch.record_result(task["original_index"], {
+                    "original_index": task["original_index"],
+                    "original_filename": task["original_filename"],
+                    "input_path": task["word_path"],
+                    "output_filename": None,
+                    "output_path": None,
+                    "status": "Failed",
+                    "message": message,
+                    "renamed_due_to_collision": False
+                })
+            self._log(f"Marked {len(tasks)} queued file(s) as failed: {message}", "orange")
+
+        for _ in drained:
+            self._task_queue.task_done()
+        for sentinel in sentinels:
+            self._task_queue.put(sentinel)
 
     def stop_conversion(self):
         """
         Signals all worker threads to stop and marks any unstarted tasks as failed.
-        This method can be called from another thread (e.g., GUI thread).
+        Documents already being exported are finished. This method can be called from
+        another thread (e.g., GUI thread).
         """
-        if not self._workers:
+        if not self._batch_active:
             self._log("No active conversion to stop.", "orange")
             return
 
         self._log("Stopping conversion process...", "orange")
         self._stop_event.set()
+        self._mark_remaining_tasks_as_failed("Conversion stopped by user.")
+
+    def shutdown(self):
+        """
+        Stops the worker pool and quits every Word instance it keeps alive between batches.
+        Call this when the application exits; it is also registered with atexit.
+        Also stops the logger thread. Safe to call more than once; a batch started
+        afterwards starts new workers and a new logger thread.
+        """
+        if not self._workers:
+            self._stop_log_thread()
+            return
+        self._stop_event.set()
+        # Workers block on the queue; one sentinel per live worker wakes each of them to exit.
+        # Retiring workers are no longer counted and exit on the retire sentinel queued for them.
+        for _ in range(self._live_workers.value):
+            self._task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=_SHUTDOWN_JOIN_TIMEOUT)
+            if worker.is_alive():
+                self._log(f"Worker {worker.worker_id} did not finish within {_SHUTDOWN_JOIN_TIMEOUT}s; its Word instance may still be running.", "red")
+        self._workers = []
+        self._stop_log_thread()
+
+    def _collect_results(self, batch, pending, progress_callback, completed, total, num_workers=0, wait=True):
+        """
+        Moves results posted by workers into the batch's results list as they arrive and
+        reports each one to progress_callback. Runs on the thread running the batch, which is
+        the only writer of the list. The first result for a slot wins (the watchdog may fail
+        a hung document before its worker returns). While waiting, hung documents are checked
+        every _WATCHDOG_INTERVAL. With wait=False, only results already posted are collected.
+        Returns (pending, completed) after collecting.
+        """
+        next_watchdog_check = time.monotonic() + _WATCHDOG_INTERVAL
+        while pending > 0:
+            try:
+                if wait:
+                    original_index, result = batch.result_queue.get(timeout=_WATCHDOG_INTERVAL)
+                else:
+                    original_index, result = batch.result_queue.get_nowait()
+            except queue.Empty:
+                if not wait or batch.done.is_set(): # done here means no worker is left
+                    break
+            else:
+                if batch.results[original_index] is None:
+                    batch.results[original_index] = result
+                    pending -= 1
+                    completed += 1
+                    if progress_callback:
+                        try:
+                            progress_callback(result, completed, total)
+                        except Exception as e:
+                            self._log(f"Error in progress callback: {e}", "red")
+            if wait and time.monotonic() >= next_watchdog_check:
+                next_watchdog_check = time.monotonic() + _WATCHDOG_INTERVAL
+                if self._abandon_hung_workers(batch):
+                    self._ensure_workers(num_workers)
+        return pending, completed
 
-    def convert_batch_threaded(self, word_file_list, output_dir, naming_rule, num_threads=4):
+    def _abandon_hung_workers(self, batch):
+        """
+        Fails documents of this batch whose export has run longer than _DOCUMENT_TIMEOUT and
+        takes their workers out of the pool, so a hung Word instance cannot stall the batch.
+        The abandoned worker exits (and quits its Word instance) if the call ever returns.
+        Returns True if any worker was abandoned.
+        """
+        now = time.monotonic()
+        abandoned_any = False
+        for worker in self._workers:
+            task, busy_since = worker.current_task, worker.busy_since
+            if worker.abandoned or task is None or busy_since is None or task["batch"] is not batch:
+                continue
+            if now - busy_since < _DOCUMENT_TIMEOUT:
+                continue
+            if worker.current_task is not task or not worker.abandon():
+                continue # Finished or left the pool in the meantime
+            message = f"Conversion timed out after {_DOCUMENT_TIMEOUT}s; Word appears to be hung on this document."
+            self._log(f"Worker {worker.worker_id} timed out on '{task['original_filename']}' after {_DOCUMENT_TIMEOUT}s. Replacing the worker.", "red")
+            abandoned_any = True
+            batch.record_result(task["original_index"], {
+                "original_index": task["original_index"],
+                "original_filename": task["original_filename"],
+                "input_path": task["word_path"],
+                "output_filename": None,
+                "output_path": None,
+                "status": "Failed",
+                "message": message,
+                "renamed_due_to_collision": False
+            })
+        return abandoned_any
+
+    def _ensure_workers(self, count, limit=None):
+        """
+        Grows the persistent worker pool to at least 'count' live workers. Workers that left
+        the pool (e.g. because Word could not be launched) are replaced. If 'limit' is given,
+        live workers above it are retired; a batch does this before queuing its tasks, so the
+        retire sentinels are taken by idle workers ahead of any task.
+        """
+        self._workers = [worker for worker in self._workers if worker.is_alive() and not worker.abandoned]
+        if limit is not None:
+            for _ in range(self._live_workers.value - limit):
+                self._live_workers.decrement()
+                self._task_queue.put(_RETIRE_WORKER)
+        while self._live_workers.value < count:
+            self._next_worker_id += 1
+            self._live_workers.increment()
+            worker = ConversionWorker(
+                worker_id=self._next_worker_id,
+                task_queue=self._task_queue,
+                live_workers=self._live_workers,
+                log_callback=self._log,
+                stop_event=self._stop_event,
+                log_level=self._log_level
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    @staticmethod
+    def default_worker_count():
+        """
+        Returns the default number of worker threads (one Word instance each):
+        one per CPU core, capped at _MAX_DEFAULT_WORKERS.
+        """
+        return max(1, min(os.cpu_count() or 1, _MAX_DEFAULT_WORKERS))
+
+    def find_output_conflicts(self, word_file_list, output_dir, naming_rule, skip_if_newer=False):
+        """
+        Returns the proposed PDF names of a batch that already exist in output_dir and would
+        therefore be renamed, in input order. With skip_if_newer, sources the batch would skip
+        as up-to-date are left out, decided exactly as convert_batch_threaded decides them
+        (including the conversion manifest). Sources failing preflight are left out too.
+        Raises OSError if output_dir exists but cannot be read.
+        """
+        output_dir = os.path.abspath(output_dir)
+        abs_word_paths = [os.path.abspath(word_path) for word_path in word_file_list]
+        try:
+            existing_pdf_entries = {entry.name.lower(): entry for entry in os.scandir(output_dir) if entry.is_file()}
+        except FileNotFoundError:
+            return [] # Created by the batch; nothing in it can conflict
+        if not existing_pdf_entries:
+            return []
+
+        namer = self._naming_logic.resolve_namer(naming_rule)
+        source_stats = self._stat_sources(word_file_list, abs_word_paths)
+        candidates = []
+        for i, word_path in enumerate(word_file_list):
+            original_filename = os.path.basename(word_path)
+            if self._preflight_error(original_filename, abs_word_paths[i], source_stats[word_path]) is None:
+                proposed_pdf_filename = namer(os.path.splitext(original_filename)[0])
+                candidates.append((i, abs_word_paths[i], source_stats[word_path], proposed_pdf_filename))
+
+        up_to_date = {}
+        if skip_if_newer:
+            up_to_date = self._up_to_date_matches(candidates, existing_pdf_entries, self._load_manifest(output_dir))
+        return [
+            proposed_pdf_filename for i, _, _, proposed_pdf_filename in candidates
+            if i not in up_to_date and proposed_pdf_filename.lower() in existing_pdf_entries
+        ]
+
+    def convert_batch_threaded(self, word_file_list, output_dir, naming_rule, num_threads=None, skip_if_newer=False,
+                               progress_callback=None):
         """
         Performs batch conversion of WORD files to PDF using multiple threads.
 
@@ -370,13 +1166,38 @@ class BatchConverter:
             word_file_list (list): A list of full paths to WORD files.
             output_dir (str): The directory where converted PDF files will be saved.
             naming_rule (str): The rule to apply for naming the output PDF files.
-            num_threads (int): The number of worker threads to use. Defaults to 4.
+            num_threads (int, optional): The maximum number of worker threads (each with its own
+                                         Word instance) converting at once in this batch; surplus
+                                         pool workers are retired. Defaults to
+                                         default_worker_count() (one per CPU core, capped).
+            skip_if_newer (bool): If True, files whose target PDF already exists and is at least
+                                  as new as the source are skipped (status "Skipped"). Defaults to False.
+            progress_callback (callable, optional): Called with (result, completed, total) as each
+                                                    queued file finishes, on the thread running the batch.
 
         Returns:
             tuple: (final_results, converted_count, failed_count, total_files)
                    final_results: A list of dictionaries, each representing the result of a conversion,
                                   ordered by the original input list's index.
         """
+        with self._batch_lock:
+            self._start_log_thread()
+            self._batch_active = True
+            try:
+                return self._convert_batch(word_file_list, output_dir, naming_rule, num_threads, skip_if_newer, progress_callback)
+            finally:
+                self._batch_active = False
+                self._flush_logs()
+
+    def _convert_batch(self, word_file_list, output_dir, naming_rule, num_threads, skip_if_newer, progress_callback):
+        """
+        Implementation of convert_batch_threaded. See that method for details.
+        """
+        if num_threads is None:
+            num_threads = self.default_worker_count()
+        # Tasks are queued for the pool, so at least one worker must exist to process them.
+        num_threads = max(1, num_threads)
+
         if sys.platform != "win32":
             self._log("This application requires Microsoft Word and pywin32, and therefore only runs on Windows.", "red")
             return [], 0, 0, 0
@@ -385,79 +1206,184 @@ class BatchConverter:
             self._log("No WORD files provided for conversion.", "orange")
             return [], 0, 0, 0
 
-        if not os.path.isdir(output_dir):
-            try:
-                os.makedirs(output_dir)
-                self._log(f"Created output directory: {output_dir}", "blue")
-            except Exception as e:
-                self._log(f"Error: Could not create output directory '{output_dir}': {e}", "red")
-                return [], 0, 0, 0
+        # Resolve relative paths once per batch instead of once per file and output name.
+        output_dir = os.path.abspath(output_dir)
+        abs_word_paths = [os.path.abspath(word_path) for word_path in word_file_list]
 
-        self._stop_event.clear()
-        self._workers = []
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            self._log(f"Error: Could not create output directory '{output_dir}': {e}", "red")
+            return [], 0, 0, 0
 
-        self._task_queue = queue.Queue()
-        self._results_dict = {}
-        self._shared_filename_tracker = {}
-        self._tracker_lock = threading.Lock()
+        try:
+            # One directory enumeration up front instead of a stat per candidate name.
+            # DirEntry.stat() is served from the enumeration data on Windows.
+            existing_pdf_entries = {entry.name.lower(): entry for entry in os.scandir(output_dir) if entry.is_file()}
+        except OSError as e:
+            self._log(f"Error: Could not read output directory '{output_dir}': {e}", "red")
+            return [], 0, 0, 0
+
+        manifest = self._load_manifest(output_dir) if skip_if_newer else {}
+
+        self._stop_event.clear()
+        batch = _BatchContext(len(word_file_list))
+        # output_dir is absolute; PDF paths are built by concatenating onto this prefix.
+        output_prefix = output_dir if output_dir.endswith(os.sep) else output_dir + os.sep
+        existing_names = set(existing_pdf_entries)
+        name_counters = self._seed_name_counters(existing_names)
+        namer = self._naming_logic.resolve_namer(naming_rule)
+        tasks = []
 
         self._log(f"Preparing {len(word_file_list)} files for conversion...", "blue")
+        source_stats = self._stat_sources(word_file_list, abs_word_paths)
+
+        # Preflight: don't pay for a Word Documents.Open on files that cannot convert.
+        candidates = []
         for i, word_path in enumerate(word_file_list):
-            if not os.path.exists(word_path):
-                self._log(f"Skipping '{os.path.basename(word_path)}': Source file does not exist.", "red")
-                self._results_dict[i] = {
+            # Parse the path once; the display name, base name and proposed PDF name are reused below.
+            original_filename = os.path.basename(word_path)
+            source_stat = source_stats[word_path]
+            preflight_error = self._preflight_error(original_filename, abs_word_paths[i], source_stat)
+            if preflight_error:
+                self._log(f"Skipping '{original_filename}': {preflight_error}", "red")
+                batch.results[i] = {
                     "original_index": i,
-                    "original_filename": os.path.basename(word_path),
+                    "original_filename": original_filename,
                     "input_path": word_path,
                     "output_filename": None,
                     "output_path": None,
                     "status": "Failed",
-                    "message": "Source file does not exist.",
+                    "message": preflight_error,
+                    "renamed_due_to_collision": False
+                }
+                continue
+            proposed_pdf_filename = namer(os.path.splitext(original_filename)[0])
+            candidates.append((i, abs_word_paths[i], source_stat, proposed_pdf_filename))
+
+        up_to_date = self._up_to_date_matches(candidates, existing_pdf_entries, manifest) if skip_if_newer else {}
+
+        for i, abs_word_path, source_stat, proposed_pdf_filename in candidates:
+            word_path = word_file_list[i]
+            original_filename = os.path.basename(word_path)
+
+            existing_entry = up_to_date.get(i)
+            if existing_entry is not None:
+                self._log(f"Skipping '{original_filename}': '{existing_entry.name}' is already up-to-date.", "blue")
+                batch.results[i] = {
+                    "original_index": i,
+                    "original_filename": original_filename,
+                    "input_path": word_path,
+                    "output_filename": existing_entry.name,
+                    "output_path": existing_entry.path,
+                    "status": "Skipped",
+                    "message": "PDF is already up-to-date.",
                     "renamed_due_to_collision": False
                 }
                 continue
 
-            self._task_queue.put({
+            # Output names are assigned here, in input order, so workers only do COM work.
+            pdf_full_path, pdf_filename, renamed = self._get_unique_pdf_path(
+                output_prefix, proposed_pdf_filename, name_counters, existing_names
+            )
+            if len(pdf_full_path) > _MAX_PATH_LENGTH:
+                self._log(
+                    f"Output PDF path is too long ({len(pdf_full_path)} characters). "
+                    f"Windows path limit is typically 255-260 characters. "
+                    f"Please shorten the output directory path or the original filename: '{pdf_full_path}'",
+                    "red"
+                )
+                batch.results[i] = {
+                    "original_index": i,
+                    "original_filename": original_filename,
+                    "input_path": word_path,
+                    "output_filename": pdf_filename,
+                    "output_path": None,
+                    "status": "Failed",
+                    "message": f"Path exceeds {_MAX_PATH_LENGTH} chars. Shorten.",
+                    "renamed_due_to_collision": False
+                }
+                continue
+
+            tasks.append({
+                "batch": batch,
                 "original_index": i,
                 "word_path": word_path,
+                "abs_word_path": abs_word_path,
+                "original_filename": original_filename,
+                "pdf_full_path": pdf_full_path,
+                "pdf_filename": pdf_filename,
+                "renamed": renamed,
             })
-        
-        self._log(f"Queue populated with {self._task_queue.qsize()} tasks.", "blue")
 
-        for i in range(num_threads):
-            worker = ConversionWorker(
-                worker_id=i + 1,
-                task_queue=self._task_queue,
-                results_dict=self._results_dict,
-                shared_tracker=self._shared_filename_tracker,
-                tracker_lock=self._tracker_lock,
-                output_dir=output_dir,
-                naming_rule=naming_rule,
-                log_callback=self._log,
-                stop_event=self._stop_event
-            )
-            self._workers.append(worker)
-            worker.start()
+        # A PDF is usually about as large as its source; warn before Word hits a full disk.
+        if tasks:
+            queued_bytes = sum(source_stats[task["word_path"]].st_size for task in tasks)
+            try:
+                free_bytes = shutil.disk_usage(output_dir).free
+            except OSError:
+                free_bytes = None
+            if free_bytes is not None and free_bytes < queued_bytes:
+                self._log(
+                    f"Warning: Only {free_bytes // (1024 * 1024)} MB free in the output directory, "
+                    f"but the queued documents total {queued_bytes // (1024 * 1024)} MB. Conversions may fail.",
+                    "orange"
+                )
 
-        self._log("Waiting for all worker threads to finish...", "blue")
-        for worker in self._workers:
-            worker.join()
+        # Largest documents first, so a long export does not start last and leave the other
+        # workers idle at the end of the batch. Names were assigned above in input order and
+        # results are stored by original_index, so the order of the queue is not visible.
+        tasks.sort(key=lambda task: source_stats[task["word_path"]].st_size, reverse=True)
 
-        if self._task_queue.empty():
-            self._log("All worker threads have finished.", "blue")
+        # Never start more workers (and therefore Word instances) than there are tasks.
+        num_workers = min(num_threads, len(tasks))
+        if num_workers > 0:
+            self._prepare_word_early_binding()
+            # Idle workers beyond num_threads are retired; up to num_threads stay for later batches.
+            self._ensure_workers(num_workers, num_threads)
+
+        for task in tasks:
+            self._task_queue.put(task)
+        self._log(f"Queue populated with {len(tasks)} tasks.", "blue")
+
+        # Overlap reading the next documents from disk with the exports in progress.
+        if len(tasks) > num_workers:
+            threading.Thread(
+                target=self._read_ahead_sources,
+                args=(batch, [task["abs_word_path"] for task in tasks], num_workers),
+                daemon=True
+            ).start()
+
+        total_files = len(word_file_list)
+        pending, completed = len(tasks), total_files - len(tasks)
+        if tasks:
+            self._log("Waiting for all queued files to be processed...", "blue")
+            pending, completed = self._collect_results(
+                batch, pending, progress_callback, completed, total_files, num_workers
+            )
+
+        if pending > 0:
+            self._mark_remaining_tasks_as_failed("Not converted: no worker could launch Word Application.")
+            pending, completed = self._collect_results(
+                batch, pending, progress_callback, completed, total_files, wait=False
+            )
+            self._log("Conversion stopped. All remaining tasks marked as failed.", "orange")
         elif self._stop_event.is_set():
-            self._mark_remaining_tasks_as_failed()
-            self._log("All workers signaled to stop and joined.", "blue")
+            self._log("Conversion stopped. Files not yet started were marked as failed.", "orange")
         else:
-            self._mark_remaining_tasks_as_failed()
-            self._log("Conversion stopped. All remaining tasks marked as failed.", "orange")
+            self._log("All queued files have been processed.", "blue")
+
+        batch.done.set() # Ends read-ahead
+        final_results = batch.results
 
-        final_results = [self._results_dict[i] for i in sorted(self._results_dict.keys())]
+        if skip_if_newer:
+            self._save_manifest(output_dir, manifest, final_results, abs_word_paths, source_stats, set(up_to_date))
         
-        converted_count = sum(1 for r in final_results if r["status"] == "Success")
-        failed_count = sum(1 for r in final_results if r["status"] == "Failed")
-        total_files = len(final_results)
+        status_counts = Counter(r["status"] for r in final_results)
+        converted_count = status_counts["Success"]
+        failed_count = status_counts["Failed"]
+        skipped_count = status_counts["Skipped"]
 
-        self._log(f"Batch conversion complete. Converted: {converted_count}, Failed: {failed_count}, Total: {total_files}", "blue")
+        self._log(f"Batch conversion complete. Converted: {converted_count}, Failed: {failed_count}, Skipped: {skipped_count}, Total: {total_files}", "blue")
 
         return final_results, converted_count, failed_count, total_files